@@ -0,0 +1,70 @@
+import sys
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the parent directory to the path so we can import the src module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.course_details import get_course_details_many
+from src.storage import upload_to_gcs, ensure_bucket_exists
+
+def main():
+    """
+    Example script fetching details for several courses concurrently and
+    uploading the JSON dumps to GCS in one batch.
+
+    Both the detail fetches and the uploads run on thread pools, so the
+    total time is bounded by the slowest request rather than the sum.
+    """
+    # Check for bucket name as command line argument
+    if len(sys.argv) < 2:
+        print("Usage: python details_to_gcs.py <bucket-name> [slug ...]")
+        return
+
+    bucket_name = sys.argv[1]
+
+    # Default slugs, overridable from the command line
+    slugs = sys.argv[2:] or [
+        "machine-learning",
+        "python",
+        "deep-learning-specialization"
+    ]
+
+    print(f"Fetching details for {len(slugs)} courses...")
+    results = get_course_details_many(slugs)
+
+    # Write the successful responses to local JSON files
+    file_paths = []
+    for slug, response in results.items():
+        if not response:
+            print(f"Failed to get details for {slug}")
+            continue
+        file_path = f"{slug}_details.json"
+        with open(file_path, "w") as f:
+            json.dump(response, f, indent=2)
+        file_paths.append(file_path)
+
+    if not file_paths:
+        print("No course details fetched. Exiting.")
+        return
+
+    # Verify the bucket once, then upload all files from a thread pool
+    if not ensure_bucket_exists(bucket_name):
+        print("Bucket is not accessible. Exiting.")
+        return
+
+    print(f"Uploading {len(file_paths)} files to bucket {bucket_name}...")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        uploads = list(executor.map(
+            lambda path: upload_to_gcs(path, bucket_name), file_paths
+        ))
+
+    for file_path, result in zip(file_paths, uploads):
+        if result:
+            print(f"Uploaded {file_path} to {result['path']}")
+        else:
+            print(f"Failed to upload {file_path}")
+
+if __name__ == "__main__":
+    main()
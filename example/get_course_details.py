@@ -1,15 +1,37 @@
 import sys
 import json
 import os
+import asyncio
+
+import aiohttp
+import aiofiles
 
 # Add the parent directory to the path so we can import the src module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.course_details import get_course_details, extract_basic_info
+from src.course_details import get_course_details_async, extract_basic_info
+
+async def fetch_and_save(session, slug):
+    """Fetch details for one course and save the full response to a JSON file"""
+    print(f"Fetching details for course: {slug}")
+    # Request the full query variant since this example saves the complete
+    # response to disk
+    response = await get_course_details_async(session, slug, fields="full")
+
+    if response:
+        # Save the full response without blocking the event loop
+        async with aiofiles.open(f"{slug}_details.json", "w") as f:
+            await f.write(json.dumps(response, indent=2))
+        print(f"Full details saved to {slug}_details.json")
+
+    return slug, response
 
-def main():
+async def main():
     """
-    Example script demonstrating how to get details for specific courses
+    Example script demonstrating how to get details for specific courses.
+
+    All courses are fetched concurrently over a pooled aiohttp session, so the
+    total latency is roughly one round trip instead of one per course.
     """
     # Example course slugs to test
     test_courses = [
@@ -20,32 +42,31 @@ def main():
 
     print("Coursera API Test - Course Details\n")
 
-    for slug in test_courses:
-        print(f"\nFetching details for course: {slug}")
-        response = get_course_details(slug)
-
-        if response:
-            # Extract and display basic information
-            course_info = extract_basic_info(response)
-            
-            if course_info:
-                # Print formatted information
-                print("\n---- COURSE DETAILS ----")
-                print(f"Name: {course_info['name']}")
-                print(f"Level: {course_info['level']}")
-                print(f"Workload: {course_info['workload']}")
-                print(f"Partners: {', '.join(course_info['partners'])}")
-                print(f"Instructors: {', '.join(course_info['instructors'])}")
-                print(f"Rating: {course_info['rating']} ({course_info['ratingCount']} ratings)")
-                print(f"Skills: {course_info['skills']}")
-                print(f"Description: {course_info['description']}")
-
-            # Optionally save the full response to a JSON file
-            with open(f"{slug}_details.json", "w") as f:
-                json.dump(response, f, indent=2)
-            print(f"Full details saved to {slug}_details.json")
-        else:
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *[fetch_and_save(session, slug) for slug in test_courses]
+        )
+
+    for slug, response in results:
+        if not response:
             print(f"Failed to get details for {slug}")
+            continue
+
+        # Extract and display basic information
+        course_info = extract_basic_info(response)
+
+        if course_info:
+            # Print formatted information
+            print("\n---- COURSE DETAILS ----")
+            print(f"Name: {course_info['name']}")
+            print(f"Level: {course_info['level']}")
+            print(f"Workload: {course_info['workload']}")
+            print(f"Partners: {', '.join(course_info['partners'])}")
+            print(f"Instructors: {', '.join(course_info['instructors'])}")
+            print(f"Rating: {course_info['rating']} ({course_info['ratingCount']} ratings)")
+            print(f"Skills: {course_info['skills']}")
+            print(f"Description: {course_info['description']}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
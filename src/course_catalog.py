@@ -1,23 +1,139 @@
 import requests
 import json
-import pandas as pd
+import csv
+import io
 import os
-import time
-import re
 from datetime import datetime
+from src.http_client import build_session
+
+# Shared session with keep-alive pooling, retry backoff and (when
+# requests-cache is installed) an on-disk response cache, so repeated
+# extract runs skip both the TLS handshake and the network round trip
+_SESSION = build_session()
+
+# Endpoint that most recently returned course data; later calls try it
+# first so they don't walk the fallback chain through dead endpoints
+_preferred_endpoint = None
+
+# ijson lets us parse the catalog response incrementally instead of loading
+# the whole JSON tree; it picks its fastest available backend (yajl2_c) on
+# import. Fall back to response.json() if it isn't installed.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def _element_to_course(element):
+    """Map a catalogResults.v2-style element to our course dictionary"""
+    return {
+        "id": element.get("id", ""),
+        "name": element.get("name", ""),
+        "slug": element.get("slug", ""),
+        "description": element.get("description", ""),
+        "partnerNames": [p.get("name", "") for p in element.get("partners", [])],
+        "skills": [s.get("name", "") for s in element.get("skills", [])],
+        "avgLearningHours": element.get("workload", ""),
+        "rating": element.get("rating", "")
+    }
+
+def _linked_to_course(course):
+    """Map a linked courses.v1-style entry to our course dictionary"""
+    return {
+        "id": course.get("id", ""),
+        "name": course.get("name", ""),
+        "slug": course.get("slug", ""),
+        "description": course.get("description", ""),
+        "partnerNames": course.get("partnerNames", []),
+        "skills": course.get("topicIds", []),  # May need transformation
+        "avgLearningHours": course.get("workload", ""),
+        "rating": course.get("rating", "")
+    }
+
+def _catalog_stream_source(response):
+    """
+    Return a file-like object over the response body for stream-parsing.
+
+    Responses replayed from the requests-cache backend don't expose a live
+    raw stream that ijson can read incrementally, so cache hits are parsed
+    from their buffered content instead.
+
+    Args:
+        response (requests.Response): Response fetched with stream=True
+
+    Returns:
+        file-like: Readable binary source for the response body
+    """
+    if getattr(response, "from_cache", False):
+        return io.BytesIO(response.content)
+
+    # Let urllib3 decompress the wire encoding before ijson sees it
+    response.raw.decode_content = True
+    return response.raw
+
+def _parse_catalog_stream(raw, limit):
+    """
+    Incrementally parse a catalog response body, building course dicts as
+    each element completes instead of materializing the whole JSON tree.
+
+    Both response structures are collected in a single pass, but with the
+    same precedence as the response.json() path: "elements" wins, and the
+    "linked.courses.v1" entries are only used when the body has no
+    elements at all. Reading stops once limit element courses are seen.
+    """
+    from ijson.common import ObjectBuilder
+
+    element_courses = []
+    linked_courses = []
+    builder = None
+    target = None
+    sink = None
+    to_course = None
+
+    # Hoist the loop-invariant prefix tuple out of the per-event hot path
+    item_prefixes = ("elements.item", "linked.courses.v1.item")
+
+    for prefix, event, value in ijson.parse(raw):
+        if builder is None:
+            if event == "start_map" and prefix in item_prefixes:
+                builder = ObjectBuilder()
+                target = prefix
+                if prefix == "elements.item":
+                    sink, to_course = element_courses, _element_to_course
+                else:
+                    sink, to_course = linked_courses, _linked_to_course
+            else:
+                continue
+
+        builder.event(event, value)
+
+        if event == "end_map" and prefix == target:
+            sink.append(to_course(builder.value))
+            builder = None
+            # Only elements can short-circuit: linked courses are discarded
+            # if elements show up later in the stream, so we must keep
+            # reading until enough elements arrive or the body ends
+            if len(element_courses) >= limit:
+                break
+
+    if element_courses:
+        return element_courses[:limit]
+    return linked_courses[:limit]
 
 def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
     """
     Extract course data from Coursera's API with improved error handling and debugging
-    
+
     Args:
         query_params (dict, optional): Additional query parameters
         limit (int, optional): Maximum number of courses to retrieve
-        max_retries (int, optional): Number of retry attempts per endpoint
-        
+        max_retries (int, optional): Retained for backwards compatibility;
+            retries are handled by the shared session's adapter
+
     Returns:
         list: List of course dictionaries or empty list if failed
     """
+    global _preferred_endpoint
+
     # Coursera has multiple potential endpoints we can try
     endpoints = [
         "https://www.coursera.org/api/catalogResults.v2",    # Standard catalog results API
@@ -25,6 +141,11 @@ def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
         "https://www.coursera.org/api/browse/courses"        # Browse courses API (backup)
     ]
 
+    # Put the endpoint that last worked at the front of the chain
+    if _preferred_endpoint in endpoints:
+        endpoints.remove(_preferred_endpoint)
+        endpoints.insert(0, _preferred_endpoint)
+
     # More complete headers to mimic browser request
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
@@ -50,30 +171,29 @@ def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
     if query_params:
         params.update(query_params)
 
-    # Try each endpoint with retries
+    # Try each endpoint; transient errors are retried with backoff by the
+    # session adapter, so a failure here means the endpoint is exhausted
     for endpoint in endpoints:
-        for attempt in range(max_retries):
-            try:
-                print(f"Trying endpoint {endpoint} (attempt {attempt+1}/{max_retries})...")
-                response = requests.get(endpoint, headers=headers, params=params)
-
-                print(f"Response status code: {response.status_code}")
-
-                if response.status_code != 200:
-                    print(f"Error: Received status code {response.status_code}")
-                    if attempt < max_retries - 1:
-                        print(f"Retrying in {2 ** attempt} seconds...")
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        print(f"Failed after {max_retries} attempts with endpoint {endpoint}")
-                        break
-
-                # Debug info: Print the first 100 characters of the response
-                print(f"Response preview: {response.text[:100]}...")
-
+        try:
+            print(f"Trying endpoint {endpoint}...")
+            response = _SESSION.get(endpoint, headers=headers, params=params,
+                                    stream=ijson is not None)
+
+            print(f"Response status code: {response.status_code}")
+
+            if response.status_code != 200:
+                print(f"Error: Received status code {response.status_code}")
+                continue
+
+            if ijson is not None:
+                # Stream-parse the body, keeping only the fields we use and
+                # stopping as soon as limit courses have been collected
+                with response:
+                    courses = _parse_catalog_stream(
+                        _catalog_stream_source(response), limit)
+            else:
                 # Parse the JSON
-                data = response.json()
+                data = _json_loads(response.content)
 
                 # Extract course data from the response
                 courses = []
@@ -81,58 +201,29 @@ def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
                 # Different APIs have different response structures, handle each case
                 if "elements" in data:
                     # Standard catalog API structure
-                    for element in data.get("elements", []):
-                        courses.append({
-                            "id": element.get("id", ""),
-                            "name": element.get("name", ""),
-                            "slug": element.get("slug", ""),
-                            "description": element.get("description", ""),
-                            "partnerNames": [p.get("name", "") for p in element.get("partners", [])],
-                            "skills": [s.get("name", "") for s in element.get("skills", [])],
-                            "avgLearningHours": element.get("workload", ""),
-                            "rating": element.get("rating", "")
-                        })
+                    courses = [_element_to_course(e) for e in data.get("elements", [])[:limit]]
                 elif "linked" in data and "courses.v1" in data.get("linked", {}):
                     # Alternative API structure
-                    for course in data["linked"]["courses.v1"]:
-                        courses.append({
-                            "id": course.get("id", ""),
-                            "name": course.get("name", ""),
-                            "slug": course.get("slug", ""),
-                            "description": course.get("description", ""),
-                            "partnerNames": course.get("partnerNames", []),
-                            "skills": course.get("topicIds", []),  # May need transformation
-                            "avgLearningHours": course.get("workload", ""),
-                            "rating": course.get("rating", "")
-                        })
-
-                if courses:
-                    print(f"Successfully extracted {len(courses)} courses")
-                    return courses
-                else:
-                    print("No courses found in response data structure")
+                    courses = [_linked_to_course(c) for c in data["linked"]["courses.v1"][:limit]]
+
+            if courses:
+                print(f"Successfully extracted {len(courses)} courses")
+                _preferred_endpoint = endpoint
+                return courses
+            else:
+                print("No courses found in response data structure")
+                if ijson is None:
                     print(f"Response keys: {list(data.keys())}")
-                    if attempt < max_retries - 1:
-                        print(f"Retrying in {2 ** attempt} seconds...")
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
 
-            except requests.exceptions.RequestException as e:
-                print(f"Network error: {e}")
-                if attempt < max_retries - 1:
-                    print(f"Retrying in {2 ** attempt} seconds...")
-                    time.sleep(2 ** attempt)
-                else:
-                    print(f"Failed after {max_retries} attempts with endpoint {endpoint}")
-            except json.JSONDecodeError as e:
-                print(f"JSON parsing error: {e}")
-                print(f"Raw response (first 200 chars): {response.text[:200]}")
-                if attempt < max_retries - 1:
-                    print(f"Retrying in {2 ** attempt} seconds...")
-                    time.sleep(2 ** attempt)
-                else:
-                    print(f"Failed after {max_retries} attempts with endpoint {endpoint}")
+        except requests.exceptions.RequestException as e:
+            print(f"Network error: {e}")
+            print(f"Endpoint {endpoint} failed, trying next endpoint")
+        except ValueError as e:
+            # Covers JSONDecodeError from any of the json backends
+            print(f"JSON parsing error: {e}")
+            print(f"Raw response (first 200 chars): {response.text[:200]}")
+        except Exception as e:
+            print(f"Error parsing response from {endpoint}: {e}")
 
     # If we've tried all endpoints and still failed, try a completely different approach
     print("All API endpoints failed. Trying to scrape course data from HTML...")
@@ -142,23 +233,22 @@ def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
         browse_url = "https://www.coursera.org/browse/data-science"
 
         print(f"Fetching HTML from {browse_url}...")
-        response = requests.get(browse_url, headers={
+        response = _SESSION.get(browse_url, headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
         })
 
         if response.status_code == 200:
             print("Successfully fetched course browse page")
 
-            # Look for JSON data in the HTML (common pattern in modern websites)
-            html = response.text
-
-            # A common pattern is to have a script tag with JSON data
-            json_matches = re.findall(r'<script id="initialState" type="application/json">(.*?)</script>', html)
+            # Look for JSON data in the HTML (common pattern in modern
+            # websites); a single marker scan finds and parses the blob
+            try:
+                initial_data = _extract_initial_state(response.text)
 
-            if json_matches:
-                print("Found initialState JSON data in the page")
-                try:
-                    initial_data = json.loads(json_matches[0])
+                if initial_data is None:
+                    print("Could not find initialState JSON in the HTML")
+                else:
+                    print("Found initialState JSON data in the page")
 
                     # Extract courses from the initial state data
                     # The exact path will depend on the structure; this is a common pattern
@@ -183,10 +273,8 @@ def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
                         return courses
                     else:
                         print("Could not find course data in the initialState JSON")
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing JSON from HTML: {e}")
-            else:
-                print("Could not find initialState JSON in the HTML")
+            except ValueError as e:
+                print(f"Error parsing JSON from HTML: {e}")
         else:
             print(f"Failed to fetch HTML: Status code {response.status_code}")
 
@@ -197,13 +285,84 @@ def extract_coursera_courses(query_params=None, limit=20, max_retries=3):
     print("All extraction methods failed. Could not retrieve course data.")
     return []
 
+# PyArrow's C++ CSV writer serializes columnar buffers far faster than
+# row-at-a-time Python writing; use it when available
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
+# Prefer a C JSON parser for the hot parse paths; all three expose a
+# loads() that accepts str or bytes
+try:
+    import orjson as _fast_json
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = json
+_json_loads = _fast_json.loads
+
+# Markers delimiting the embedded initialState JSON blob in Coursera's
+# HTML pages
+_INITIAL_STATE_OPEN = '<script id="initialState" type="application/json">'
+_INITIAL_STATE_CLOSE = '</script>'
+
+def _extract_initial_state(html):
+    """
+    Locate and parse the initialState JSON embedded in an HTML page.
+
+    Scans for the script-tag markers with str.find instead of running a
+    regex over the whole document, so only the JSON slice itself is ever
+    copied or parsed.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        dict: Parsed initialState data, or None if the blob wasn't found
+    """
+    start = html.find(_INITIAL_STATE_OPEN)
+    if start == -1:
+        return None
+    start += len(_INITIAL_STATE_OPEN)
+
+    end = html.find(_INITIAL_STATE_CLOSE, start)
+    if end == -1:
+        return None
+
+    return _json_loads(html[start:end])
+
+# Column order for the CSV export
+_CSV_HEADER = ("id", "name", "slug", "description", "learning_hours",
+               "partners", "skills", "rating")
+
+# Single-pass replacement of line breaks with spaces in free-text fields
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+def _course_rows(courses):
+    """Yield one flat CSV row tuple per course dictionary, with line breaks
+    in free-text fields replaced by spaces in a single translate pass"""
+    for course in courses:
+        yield (
+            course.get("id", ""),
+            course.get("name", "").translate(_NL_TABLE),
+            course.get("slug", ""),
+            course.get("description", "").translate(_NL_TABLE),
+            course.get("avgLearningHours", ""),
+            ", ".join(course.get("partnerNames", [])).translate(_NL_TABLE),
+            ", ".join(course.get("skills", [])).translate(_NL_TABLE),
+            course.get("rating", "")
+        )
+
 def convert_to_csv(courses):
     """
-    Convert course data to a pandas DataFrame and save as CSV
-    
+    Save course data as a CSV file
+
     Args:
         courses (list): List of course dictionaries
-        
+
     Returns:
         str: Path to the saved CSV file or None if failed
     """
@@ -211,31 +370,27 @@ def convert_to_csv(courses):
         print("No courses to convert to CSV")
         return None
 
-    # Normalize data and handle nested fields
-    processed_courses = []
-
-    for course in courses:
-        course_data = {
-            "id": course.get("id", ""),
-            "name": course.get("name", ""),
-            "slug": course.get("slug", ""),
-            "description": course.get("description", "").replace("\n", " ").replace("\r", " "),  # Remove line breaks
-            "learning_hours": course.get("avgLearningHours", ""),
-            "partners": ", ".join(course.get("partnerNames", [])),
-            "skills": ", ".join(course.get("skills", [])),
-            "rating": course.get("rating", "")
-        }
-        processed_courses.append(course_data)
-
-    # Create DataFrame
-    df = pd.DataFrame(processed_courses)
-
     # Generate a timestamp for the filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     file_path = f"coursera_courses_{timestamp}.csv"
 
-    # Save as CSV
-    df.to_csv(file_path, index=False, encoding='utf-8')
+    if pa is not None:
+        # Fast path: hand the rows to PyArrow's C++ CSV writer
+        # Stringify values so every column has a uniform Arrow type, matching
+        # what csv.writer would emit
+        table = pa.Table.from_pylist(
+            [dict(zip(_CSV_HEADER, map(str, row))) for row in _course_rows(courses)]
+        )
+        pa_csv.write_csv(table, file_path,
+                         write_options=pa_csv.WriteOptions(include_header=True))
+    else:
+        # Write rows straight from a generator so memory stays flat
+        # regardless of how many courses were extracted
+        with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(_CSV_HEADER)
+            writer.writerows(_course_rows(courses))
+
     print(f"Data saved to {file_path}")
 
     return file_path
\ No newline at end of file
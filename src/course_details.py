@@ -1,30 +1,66 @@
-import requests
 import json
 
-def get_course_details(course_slug):
-    """
-    Gets detailed information for a specific course using its slug.
+from src.http_client import build_session
 
-    Args:
-        course_slug (str): The course slug (from the URL)
+# Prefer a C JSON parser for decoding GraphQL responses
+try:
+    import orjson as _fast_json
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = json
+_json_loads = _fast_json.loads
 
-    Returns:
-        dict: Detailed course information
-    """
-    url = "https://www.coursera.org/graphql-gateway"
-    operation_name = "CDPPageQuery"
+# Shared session with keep-alive pooling, retry backoff and (when
+# requests-cache is installed) an on-disk response cache
+_SESSION = build_session()
 
-    # Headers to mimic browser request
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "application/json",
-        "Origin": "https://www.coursera.org",
-        "Referer": f"https://www.coursera.org/learn/{course_slug}"
+# GraphQL endpoint and operation shared by the sync and async fetchers
+GRAPHQL_URL = "https://www.coursera.org/graphql-gateway"
+OPERATION_NAME = "CDPPageQuery"
+
+# Trimmed GraphQL query covering only the fields extract_basic_info reads,
+# so the gateway resolves and ships less; the default for detail fetches
+CDP_PAGE_QUERY_MINIMAL = """
+    query CDPPageQuery($slug: String!) {
+      XdpV1Resource {
+        slug(productType: "COURSE", slug: $slug) {
+          elements {
+            id
+            xdpMetadata {
+              ... on XdpV1_cdpMetadataMember {
+                cdpMetadata {
+                  id
+                  level
+                  skills
+                  name
+                  slug
+                  description
+                  workload
+                  partners {
+                    name
+                  }
+                  instructors {
+                    fullName
+                  }
+                  ratings {
+                    averageFiveStarRating
+                    ratingCount
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
     }
+    """
 
-    # GraphQL query based on the provided schema
-    query = """
+# Full GraphQL query based on the provided schema, for callers that want
+# the complete course metadata (photos, domains, certificates, languages,
+# instructor titles, partner logos) at the cost of a larger payload
+CDP_PAGE_QUERY_FULL = """
     query CDPPageQuery($slug: String!) {
       XdpV1Resource {
         slug(productType: "COURSE", slug: $slug) {
@@ -79,23 +115,148 @@ def get_course_details(course_slug):
     }
     """
 
-    # Request body
-    payload = {
-        "operationName": operation_name,
+# Query variants selectable via the fields kwarg on the fetch functions
+_QUERIES = {
+    "minimal": CDP_PAGE_QUERY_MINIMAL,
+    "full": CDP_PAGE_QUERY_FULL
+}
+
+def _build_headers(course_slug):
+    """Build browser-like request headers for a course detail request"""
+    return {
+        "Content-Type": "application/json",
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept": "application/json",
+        "Origin": "https://www.coursera.org",
+        "Referer": f"https://www.coursera.org/learn/{course_slug}"
+    }
+
+def _build_payload(course_slug, fields="minimal"):
+    """Build the GraphQL request body for a course detail request"""
+    return {
+        "operationName": OPERATION_NAME,
         "variables": {"slug": course_slug},
-        "query": query
+        "query": _QUERIES[fields]
     }
 
+def get_course_details(course_slug, fields="minimal"):
+    """
+    Gets detailed information for a specific course using its slug.
+
+    Args:
+        course_slug (str): The course slug (from the URL)
+        fields (str, optional): "minimal" (default) requests only the
+            fields extract_basic_info reads; "full" requests the complete
+            course metadata at the cost of a larger payload
+
+    Returns:
+        dict: Detailed course information
+    """
     # Make the request
-    response = requests.post(url, headers=headers, json=payload)
+    response = _SESSION.post(GRAPHQL_URL, headers=_build_headers(course_slug),
+                             json=_build_payload(course_slug, fields))
 
     if response.status_code == 200:
-        return response.json()
+        return _json_loads(response.content)
     else:
         print(f"Error: {response.status_code}")
         print(response.text)
         return None
 
+async def get_course_details_async(session, course_slug, fields="minimal"):
+    """
+    Async variant of get_course_details for fetching many courses concurrently.
+
+    Args:
+        session (aiohttp.ClientSession): Shared client session for the requests
+        course_slug (str): The course slug (from the URL)
+        fields (str, optional): "minimal" or "full" query variant
+
+    Returns:
+        dict: Detailed course information or None if the request failed
+    """
+    async with session.post(GRAPHQL_URL, headers=_build_headers(course_slug),
+                            json=_build_payload(course_slug, fields)) as response:
+        if response.status == 200:
+            return await response.json(loads=_json_loads)
+        else:
+            print(f"Error: {response.status}")
+            print(await response.text())
+            return None
+
+async def get_course_details_bulk(course_slugs, concurrency=8, fields="minimal"):
+    """
+    Fetch details for many courses concurrently with a bounded worker pool.
+
+    A semaphore caps the number of in-flight requests so bulk callers can
+    pipeline hundreds of slugs without opening one connection per slug or
+    tripping the API's rate limits.
+
+    Args:
+        course_slugs (list): Course slugs to fetch
+        concurrency (int, optional): Maximum number of in-flight requests
+        fields (str, optional): "minimal" or "full" query variant
+
+    Returns:
+        dict: Mapping of slug to response dict (None for failed fetches)
+    """
+    import aiohttp
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(session, slug):
+        async with semaphore:
+            return await get_course_details_async(session, slug, fields)
+
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # return_exceptions keeps one failed slug from discarding the rest
+        results = await asyncio.gather(
+            *[fetch(session, slug) for slug in course_slugs],
+            return_exceptions=True
+        )
+
+    details = {}
+    for slug, result in zip(course_slugs, results):
+        if isinstance(result, BaseException):
+            print(f"Error fetching details for {slug}: {result}")
+            result = None
+        details[slug] = result
+
+    return details
+
+def get_course_details_many(course_slugs, max_workers=8, fields="minimal"):
+    """
+    Fetch details for many courses concurrently using a thread pool.
+
+    Synchronous counterpart to get_course_details_bulk for callers not
+    running an event loop; the workers share the pooled session, so the
+    fetches overlap their network waits on existing connections.
+
+    Args:
+        course_slugs (list): Course slugs to fetch
+        max_workers (int, optional): Maximum number of worker threads
+        fields (str, optional): "minimal" or "full" query variant
+
+    Returns:
+        dict: Mapping of slug to response dict (None for failed fetches)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(slug):
+        # Catch per-slug failures so one bad course doesn't kill the batch
+        try:
+            return get_course_details(slug, fields)
+        except Exception as e:
+            print(f"Error fetching details for {slug}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        responses = list(executor.map(fetch, course_slugs))
+
+    return dict(zip(course_slugs, responses))
+
 def extract_basic_info(response_data):
     """
     Extract and print basic information from the API response
@@ -116,17 +277,27 @@ def extract_basic_info(response_data):
         course = elements[0]
         metadata = course["xdpMetadata"]["cdpMetadata"]
 
+        # Look up optional fields once and build derived strings a single
+        # time instead of repeating the lookups/joins inline
+        description = metadata.get("description") or ""
+        skills = metadata.get("skills") or []
+        ratings = metadata.get("ratings") or {}
+
+        skills_text = ", ".join(skills[:5])
+        if len(skills) > 5:
+            skills_text += "..."
+
         # Extract basic information
         info = {
-            "name": metadata["name"],
-            "description": metadata["description"][:100] + "..." if metadata["description"] else "N/A",
-            "level": metadata["level"],
-            "workload": metadata["workload"],
-            "skills": ", ".join(metadata["skills"][:5]) + "..." if len(metadata["skills"]) > 5 else ", ".join(metadata["skills"]),
-            "partners": [p["name"] for p in metadata["partners"]],
-            "instructors": [i["fullName"] for i in metadata["instructors"]],
-            "rating": metadata["ratings"]["averageFiveStarRating"] if "ratings" in metadata else "N/A",
-            "ratingCount": metadata["ratings"]["ratingCount"] if "ratings" in metadata else "N/A"
+            "name": metadata.get("name", ""),
+            "description": description[:100] + "..." if description else "N/A",
+            "level": metadata.get("level", ""),
+            "workload": metadata.get("workload", ""),
+            "skills": skills_text,
+            "partners": [p["name"] for p in metadata.get("partners", [])],
+            "instructors": [i["fullName"] for i in metadata.get("instructors", [])],
+            "rating": ratings.get("averageFiveStarRating", "N/A"),
+            "ratingCount": ratings.get("ratingCount", "N/A")
         }
 
         return info
@@ -0,0 +1,45 @@
+import sys
+import os
+import io
+import json
+import unittest
+
+# Add the parent directory to the path so we can import the src module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.course_catalog import ijson, _parse_catalog_stream
+
+def _body(data):
+    return io.BytesIO(json.dumps(data).encode("utf-8"))
+
+@unittest.skipUnless(ijson is not None, "requires ijson")
+class TestParseCatalogStream(unittest.TestCase):
+    """The stream parser must keep the same precedence as the
+    response.json() fallback: elements win over linked.courses.v1"""
+
+    def test_elements_take_precedence_over_linked(self):
+        data = {
+            "elements": [{"id": "e1", "name": "Element One"},
+                         {"id": "e2", "name": "Element Two"}],
+            "linked": {"courses.v1": [{"id": "l1", "name": "Linked One"}]}
+        }
+        courses = _parse_catalog_stream(_body(data), 10)
+        self.assertEqual([c["id"] for c in courses], ["e1", "e2"])
+
+    def test_linked_used_when_no_elements(self):
+        data = {
+            "linked": {"courses.v1": [{"id": "l1", "name": "Linked One"},
+                                      {"id": "l2", "name": "Linked Two"}]}
+        }
+        courses = _parse_catalog_stream(_body(data), 10)
+        self.assertEqual([c["id"] for c in courses], ["l1", "l2"])
+
+    def test_limit_applies_to_either_shape(self):
+        data = {
+            "elements": [{"id": f"e{i}"} for i in range(5)]
+        }
+        courses = _parse_catalog_stream(_body(data), 3)
+        self.assertEqual([c["id"] for c in courses], ["e0", "e1", "e2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import os
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Add the parent directory to the path so we can import the src module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.http_client import build_session, requests_cache
+from src.course_catalog import ijson, _catalog_stream_source, _parse_catalog_stream
+
+_CATALOG_BODY = json.dumps({
+    "elements": [
+        {
+            "id": "c1",
+            "name": "Course One",
+            "slug": "course-one",
+            "description": "A course",
+            "partners": [{"name": "Partner"}],
+            "skills": [{"name": "Skill"}],
+            "workload": "4 hours",
+            "rating": 4.5
+        }
+    ]
+}).encode("utf-8")
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    """Serves a fixed catalog-shaped JSON body"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_CATALOG_BODY)))
+        self.end_headers()
+        self.wfile.write(_CATALOG_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+@unittest.skipUnless(requests_cache is not None and ijson is not None,
+                     "requires requests-cache and ijson")
+class TestWarmCacheStreaming(unittest.TestCase):
+    """Regression test: stream-parsing must also work on replayed cache hits,
+    whose responses don't expose a live raw stream"""
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _CatalogHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/catalog"
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.environ["COURSERA_CACHE"] = "1"
+        self.session = build_session(
+            cache_name=os.path.join(self.tmpdir.name, "test_cache"))
+
+    def tearDown(self):
+        self.session.close()
+        os.environ.pop("COURSERA_CACHE", None)
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def test_stream_parse_cold_and_warm(self):
+        """The second (cached) fetch must parse the same as the first"""
+        for run in ("cold", "warm"):
+            response = self.session.get(self.url, stream=True)
+            with response:
+                courses = _parse_catalog_stream(
+                    _catalog_stream_source(response), 10)
+            self.assertEqual(len(courses), 1, f"{run} run parsed no courses")
+            self.assertEqual(courses[0]["id"], "c1")
+            self.assertEqual(courses[0]["name"], "Course One")
+
+        # The second response really was served from the cache
+        self.assertTrue(response.from_cache)
+
+if __name__ == "__main__":
+    unittest.main()